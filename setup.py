@@ -1,5 +1,17 @@
 import setuptools
 
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize([setuptools.Extension("xmlorm._fast",
+                                                  ["xmlorm/_fast.pyx"])])
+    # cythonize() drops the flag if it's passed to Extension(). Optional
+    # extensions don't fail the install when there's no C compiler.
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    # Without Cython xmlorm falls back to its pure Python row reader
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
     
@@ -13,4 +25,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url='https://github.com/agoryuno/xml_orm',
     license='MIT',
-    packages=['xmlorm'])
+    packages=['xmlorm'],
+    package_data={'xmlorm': ['_fast.pyx']},
+    ext_modules=ext_modules,
+    extras_require={'lxml': ['lxml'], 'numpy': ['numpy']})
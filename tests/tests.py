@@ -53,6 +53,10 @@ class ColumnsTestCase(unittest.TestCase):
         col = Column("name")
         self.assertEqual(repr(col), "name text")
 
+    def test_default_type(self):
+        from xmlorm.orm import Column, TEXT
+        self.assertIs(Column("name").type, TEXT)
+
     def test_primary_key(self):
         from xmlorm.orm import Column
         col = Column("name", primary_key=True)
@@ -132,7 +136,25 @@ class TableDeclTestCase(unittest.TestCase):
             ),
             hash_key=("name", "last_name"))
         self.assertIn("hash_id", tab.columns)
-        self.assertEqual(repr(tab.columns["hash_id"]), "hash_id text primary key not null")
+        self.assertEqual(repr(tab.columns["hash_id"]), "hash_id char(32) primary key not null")
+
+    def test_hash_algo(self):
+        from hashlib import sha256
+        from xmlorm.orm import Table, Column
+
+        class ShaTable(Table):
+            hash_algo = staticmethod(sha256)
+
+        tab = ShaTable(name="people", 
+            top_tag="person/record",
+            columns=(
+                Column("name", not_null=True),
+                Column("last_name", not_null=True)
+            ),
+            hash_key=("name", "last_name"))
+        self.assertEqual(repr(tab.columns["hash_id"]), "hash_id char(64) primary key not null")
+        self.assertEqual(tab.get_hash_key({"name": "John", "last_name": "Doe"}),
+                         sha256(b"JohnDoe").hexdigest())
 
 
     #def test_
@@ -145,6 +167,235 @@ class TableDeclTestCase(unittest.TestCase):
     #            ),
     #            parent_table=tables["people"])
 
+class TableReadTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TEMP_DIR, "people.xml"), "w") as f:
+            f.write("""
+<person>
+    <record>
+        <name>John</name>
+        <last_name>Doe</last_name>
+        <age>42</age>
+        <employers>
+            <employer>
+                <name>Ames Research Center, NASA</name>
+                <address>De France Ave, Mountain View</address>
+            </employer>
+            <employer>
+                <name>JPL</name>
+            </employer>
+        </employers>
+    </record>
+    <meta>
+        <record>
+            <name>Not a person</name>
+        </record>
+    </meta>
+    <record>
+        <name>Jane</name>
+        <last_name>Roe</last_name>
+    </record>
+</person>
+""")
+
+    def make_tables(self, top_tag="record"):
+        from xmlorm.orm import Table, Column, Integer
+        people = Table(name="people",
+            top_tag=top_tag,
+            columns=(
+                Column("name", not_null=True),
+                Column("last_name", not_null=True),
+                Column("age", tpe=Integer())
+            ),
+            hash_key=("name", "last_name"))
+        employers = Table(name="employers",
+            top_tag=top_tag,
+            tag_name="employers/employer",
+            columns=(
+                Column("name", not_null=True),
+                Column("address")
+            ),
+            parent_table=people)
+        return people, employers
+
+    def test_read_parent(self):
+        people, _ = self.make_tables()
+        rows = people.read_table(TEMP_DIR)
+        self.assertEqual([(r["name"], r["last_name"], r["age"]) for r in rows],
+                         [("John", "Doe", 42), ("Jane", "Roe", None)])
+        self.assertEqual(rows[0]["hash_id"],
+                         people.get_hash_key({"name": "John", "last_name": "Doe"}))
+
+    def test_read_child(self):
+        people, employers = self.make_tables()
+        parents = people.read_table(TEMP_DIR)
+        rows = employers.read_table(TEMP_DIR)
+        self.assertEqual([(r["name"], r["address"]) for r in rows],
+                         [("Ames Research Center, NASA",
+                           "De France Ave, Mountain View"),
+                          ("JPL", None)])
+        self.assertEqual({r["parent_hash"] for r in rows},
+                         {parents[0]["hash_id"]})
+
+    def test_repeated_hash_key_tag(self):
+        people, employers = self.make_tables()
+        people.filename = "people_repeated.xml"
+        with open(os.path.join(TEMP_DIR, people.filename), "w") as f:
+            f.write("""<person><record>
+<name>John</name><last_name>Doe</last_name><name>Johnny</name>
+<employers><employer><name>JPL</name></employer></employers>
+</record></person>""")
+        parents = people.read_table(TEMP_DIR)
+        rows = employers.read_table(TEMP_DIR)
+        self.assertEqual(parents[0]["name"], "Johnny")
+        self.assertEqual(rows[0]["parent_hash"], parents[0]["hash_id"])
+
+    def test_hash_cache_size(self):
+        from unittest import mock
+        import xmlorm.orm
+        people, employers = self.make_tables()
+        parents = people.read_table(TEMP_DIR)
+        with mock.patch.object(xmlorm.orm, "_HASH_CACHE_SIZE", 1):
+            rows = employers.read_table(TEMP_DIR)
+        self.assertEqual(len(people._hash_cache), 1)
+        self.assertEqual({r["parent_hash"] for r in rows},
+                         {parents[0]["hash_id"]})
+
+    def test_parent_hash_type(self):
+        people, employers = self.make_tables()
+        self.assertEqual(repr(employers.columns["parent_hash"]),
+                         "parent_hash char(32) not null")
+
+    def test_read_paths(self):
+        for top_tag, names in (("./record", ["John", "Jane"]),
+                               (".//record", ["John", "Not a person", "Jane"]),
+                               ("record[age]", ["John"]),
+                               ("meta/record", ["Not a person"])):
+            people, _ = self.make_tables(top_tag)
+            rows = people.read_table(TEMP_DIR)
+            self.assertEqual([r["name"] for r in rows], names, top_tag)
+
+    def test_read_namespaced(self):
+        from xmlorm.orm import Table, Column
+        people, _ = self.make_tables("{http://x.org/ns}record")
+        people.filename = "people_ns.xml"
+        with open(os.path.join(TEMP_DIR, people.filename), "w") as f:
+            f.write("""<person xmlns="http://x.org/ns">
+<record><name>John</name><last_name>Doe</last_name>
+<employer><name>JPL</name></employer>
+<employer><name>NASA</name></employer></record>
+</person>""")
+        rows = people.read_table(TEMP_DIR)
+        self.assertEqual(len(rows), 1)
+
+        employers = Table(name="employers",
+            top_tag="{http://x.org/ns}record",
+            tag_name="{http://x.org/ns}employer",
+            columns=(Column("{http://x.org/ns}name"),),
+            parent_table=people)
+        rows = employers.read_table(TEMP_DIR)
+        self.assertEqual([r["{http://x.org/ns}name"] for r in rows],
+                         ["JPL", "NASA"])
+
+    def test_streaming_memory(self):
+        import xmlorm.orm
+        fname = os.path.join(TEMP_DIR, "groups.xml")
+        with open(fname, "w") as f:
+            f.write("<root>")
+            for i in range(5):
+                f.write("<skip/><group><record/><record/></group>")
+            f.write("</root>")
+        seen = 0
+        for el in xmlorm.orm._iter_records(fname, "group/record"):
+            seen += 1
+            if xmlorm.orm._LXML:
+                # Nothing parsed before the current record's branch is
+                # left in the tree (the parser may have read ahead)
+                for node in (el, *el.iterancestors()):
+                    self.assertIsNone(node.getprevious())
+        self.assertEqual(seen, 10)
+
+    def test_read_columnar(self):
+        people, employers = self.make_tables()
+        for table in (people, employers):
+            rows = table.read_table(TEMP_DIR)
+            cols = table.read_table_columnar(TEMP_DIR)
+            self.assertEqual(list(cols), list(table.columns))
+            self.assertEqual({name: list(col) for name, col in cols.items()},
+                             {name: [r[name] for r in rows]
+                              for name in table.columns})
+
+    def test_read_columnar_types(self):
+        from xmlorm.orm import Table, Column, Integer, Real, numpy
+        with open(os.path.join(TEMP_DIR, "numbers.xml"), "w") as f:
+            f.write("""<numbers>
+<row><small>1</small><big>99999999999999999999</big><real>1.5</real></row>
+<row><small>2</small><big>1</big><real>2.5</real><gaps>3</gaps></row>
+</numbers>""")
+        numbers = Table(name="numbers",
+            top_tag="row",
+            columns=(
+                Column("small", tpe=Integer()),
+                Column("big", tpe=Integer()),
+                Column("real", tpe=Real()),
+                Column("gaps", tpe=Integer())
+            ))
+        cols = numbers.read_table_columnar(TEMP_DIR)
+        self.assertEqual(cols["big"], [99999999999999999999, 1])
+        self.assertEqual(cols["gaps"], [None, 3])
+        if numpy is None:
+            self.assertEqual(cols["small"], [1, 2])
+            self.assertEqual(cols["real"], [1.5, 2.5])
+        else:
+            self.assertEqual(cols["small"].dtype, numpy.int64)
+            self.assertEqual(cols["small"].tolist(), [1, 2])
+            self.assertEqual(cols["real"].dtype, numpy.float64)
+            self.assertEqual(cols["real"].tolist(), [1.5, 2.5])
+
+    def test_hash_keys(self):
+        people, _ = self.make_tables()
+        rows = [{"name": "John", "last_name": "Doe"},
+                {"name": "Jane", "last_name": None}]
+        cols = {"name": ["John", "Jane"], "last_name": ["Doe", None]}
+        self.assertEqual(people.get_hash_keys(cols),
+                         [people.get_hash_key(r) for r in rows])
+
+
+class TableReadStdlibTestCase(TableReadTestCase):
+    """
+    Runs the reading tests with the standard library's ElementTree,
+    even if lxml is installed.
+    """
+
+    def setUp(self):
+        from unittest import mock
+        from xml.etree import ElementTree
+        import xmlorm.orm
+
+        patcher = mock.patch.multiple(xmlorm.orm, _LXML=False,
+                                      ElementTree=ElementTree,
+                                      _PARSE_OPTIONS={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TableReadPythonTestCase(TableReadTestCase):
+    """
+    Runs the reading tests with the pure Python row reader, even if
+    the compiled one in xmlorm._fast is built.
+    """
+
+    def setUp(self):
+        from unittest import mock
+        import xmlorm.orm
+
+        patcher = mock.patch.object(xmlorm.orm, "_read_row_fast", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
 def setUpModule():
     try:
         shutil.rmtree(TEMP_DIR)
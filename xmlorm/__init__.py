@@ -1,2 +1,3 @@
 from xmlorm.orm import (Table, Column, PrimaryKey, ForeignKey,
-                 Index, Integer, Real, Timestamp, Text)
+                 Index, Integer, Real, Timestamp, Text,
+                 INTEGER, REAL, TIMESTAMP, TEXT)
@@ -0,0 +1,21 @@
+# cython: language_level=3
+"""
+Compiled version of the inner loop of Table.read_row(). It's built
+when Cython is available at install time, otherwise the pure Python
+implementation in xmlorm.orm is used.
+"""
+
+
+def read_row(dict columns, dict data_types, dict row_template, node):
+    cdef dict row = row_template.copy()
+    cdef object tag, val, conv
+    for child in node:
+        tag = child.tag
+        if tag in columns:
+            val = child.text
+            if val is not None:
+                conv = data_types.get(tag)
+                if conv is not None:
+                    val = conv(val)
+            row[tag] = val
+    return row
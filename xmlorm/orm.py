@@ -58,9 +58,19 @@ and points to column 'hash_id', which is automatically created in
 'people' and filled with values generated from the contents of the
 columns specified by name in the 'hash_key' argument.
 
-The 'hash_key' value is generated as an SHA256 hash 
-(using hashlib.sha256) of the column values converted to string and 
-concatenated together.
+The 'hash_key' value is generated as a 128 bit BLAKE2b hash 
+(using hashlib.blake2b) of the column values converted to string and 
+concatenated together. The key isn't a security boundary, so a fast
+hash is used by default. To get the SHA256 keys of earlier versions 
+instead, override 'Table.hash_algo' before declaring the tables:
+
+```
+from hashlib import sha256
+
+Table.hash_algo = staticmethod(sha256)
+```
+
+The 'hash_id' column is sized to fit the digest of 'hash_algo'.
 
 
 ## Changing the name of the XML file
@@ -87,13 +97,179 @@ table.read_table(data_dir)
 where data_dir is the path to the directory containing the XML file.
 """
 import abc
-from hashlib import sha256
-from xml.etree import ElementTree
+import os
+import re
+from collections import OrderedDict
+from functools import partial
+from hashlib import blake2b
+from operator import itemgetter, methodcaller
+
+try:
+    from lxml import etree as ElementTree
+    # Drops the whitespace-only text nodes that indented dumps are
+    # full of and lifts libxml2's limits on very large documents.
+    _PARSE_OPTIONS = {"huge_tree": True, "remove_blank_text": True}
+    _LXML = True
+except ImportError:
+    from xml.etree import ElementTree
+    _PARSE_OPTIONS = {}
+    _LXML = False
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 TOP_LEVEL_TAG = "DATA_RECORDS/DATA_RECORD"
 
+# XML dumps tend to be large, read them in big chunks
+_READ_BUFFER_SIZE = 1 << 20
+
+# Number of parent hashes a Table keeps for its child tables
+_HASH_CACHE_SIZE = 8192
+
+# A plain or Clark notation ({uri}name) tag, the only kind of path 
+# step that records can be streamed for
+_TAG = r"(?:\{[^}]*\})?[\w.-]+"
+_TAG_CHAIN_RE = re.compile(rf"{_TAG}(?:/{_TAG})*")
+_TAG_RE = re.compile(_TAG)
+
+
+def _read_row(columns, data_types, row_template, node):
+    row = row_template.copy()
+    for child in node:
+        tag = child.tag
+        if tag in columns:
+            val = child.text
+            if val is not None and tag in data_types:
+                val = data_types[tag](val)
+            row[tag] = val
+    return row
+
+try:
+    # Compiled version of _read_row(), see _fast.pyx
+    from xmlorm._fast import read_row as _read_row_fast
+except ImportError:
+    _read_row_fast = None
+
+
+def _tuple_getter(keys):
+    """
+    Same as itemgetter(*keys), but always returns a tuple, even for 
+    a single key.
+    """
+    if len(keys) == 1:
+        key, = keys
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
+
+def _compile_path(path):
+    """
+    Returns a function that finds all elements at *path* below the 
+    element it's called with. lxml gets a precompiled XPath, the
+    standard library already caches parsed paths for findall().
+    Paths that lxml can't compile as XPath are left to findall() too.
+    """
+    if _LXML:
+        # ETXPath understands Clark notation tags ({uri}name)
+        xpath = ElementTree.ETXPath if "{" in path else ElementTree.XPath
+        try:
+            return xpath(path)
+        except ElementTree.XPathSyntaxError:
+            pass
+    return methodcaller("findall", path)
+
+
+def _is_record(el, tags):
+    """
+    Checks that the ancestors of *el* (an lxml element with the tag
+    tags[-1]) match the rest of *tags*, starting below the root.
+    """
+    for tag in reversed(tags[:-1]):
+        el = el.getparent()
+        if el is None or el.tag != tag:
+            return False
+    parent = el.getparent()
+    return parent is not None and parent.getparent() is None
+
+
+def _split_path(path):
+    """
+    Splits *path* into its tags if it's a simple chain of child 
+    steps, such as "a/{uri}b/c" or "./a/b". Returns None otherwise.
+    """
+    if path.startswith("./"):
+        path = path[2:]
+    if not _TAG_CHAIN_RE.fullmatch(path):
+        return None
+    tags = _TAG_RE.findall(path)
+    if any(tag.lstrip(".") == "" for tag in tags):
+        # "." and ".." steps
+        return None
+    return tags
+
+
+def _iter_records(fname, path):
+    """
+    Streams the elements found at *path* (an XPath relative to the 
+    root tag, same as for findall()) in the file *fname*.
+
+    Each element is yielded once it has been parsed in full and is
+    discarded when the caller asks for the next one, so memory use 
+    stays proportional to a single record rather than to the file.
+
+    Only simple chains of tags can be streamed. Any other path (with
+    "//", predicates, wildcards etc.) is handed to findall() on the
+    fully parsed document.
+    """
+    tags = _split_path(path)
+    with open(fname, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        if tags is None:
+            parser = ElementTree.XMLParser(**_PARSE_OPTIONS)
+            root = ElementTree.parse(f, parser=parser).getroot()
+            yield from root.findall(path)
+            return
+
+        if _LXML:
+            # lxml filters events by tag in C and keeps parent links, 
+            # so no Python code runs for elements inside records
+            for _, el in ElementTree.iterparse(f, tag=tags[-1], 
+                                               **_PARSE_OPTIONS):
+                if not _is_record(el, tags):
+                    continue
+                # Everything before this record is done with, leave
+                # only the record's own branch of the tree
+                for node in (el, *el.iterancestors()):
+                    parent = node.getparent()
+                    if parent is None:
+                        break
+                    while node.getprevious() is not None:
+                        del parent[0]
+                yield el
+                el.clear()
+            return
+
+        depth = len(tags)
+        stack = []
+        for event, el in ElementTree.iterparse(f, events=("start", "end"),
+                                               **_PARSE_OPTIONS):
+            if event == "start":
+                stack.append(el)
+                continue
+            stack.pop()
+            if len(stack) > depth:
+                # Still inside a record, keep everything until it's done
+                continue
+            if (len(stack) == depth and el.tag == tags[-1]
+                    and all(a.tag == t for a, t in zip(stack[1:], tags))):
+                yield el
+            el.clear()
+            if stack:
+                stack[-1].remove(el)
+
 
 class ColumnType(abc.ABC):
+    __slots__ = ("args",)
 
     def __init__(self, *args):
         self.args = args
@@ -112,40 +288,55 @@ class ColumnType(abc.ABC):
         return self.__repr__()
 
 class Integer(ColumnType):
+    __slots__ = ()
     sql = "integer"
 
 class Timestamp(ColumnType):
+    __slots__ = ()
     sql = "timestamp"
 
 class Real(ColumnType):
+    __slots__ = ()
     sql = "real"
 
 class Text(ColumnType):
+    __slots__ = ()
     sql = "text"
 
 class Char(ColumnType):
+    __slots__ = ()
     sql = "char"
 
 class Varchar(ColumnType):
+    __slots__ = ()
     sql = "varchar"
 
+# Column types without arguments carry no state, so these instances
+# can be shared by any number of columns.
+TEXT = Text()
+INTEGER = Integer()
+REAL = Real()
+TIMESTAMP = Timestamp()
+
 class Column:
     """
     Defines a column in a table.
     tpe - column type, one of Integer, Timestamp, Real or Text 
-    (Text by default)
+    (Text by default). The module level INTEGER, TIMESTAMP, REAL and 
+    TEXT instances can be used instead of creating new ones.
     """
 
     def __init__(self, name, tpe=None, not_null=False, primary_key=False):
         self.name = name
-        self.type = tpe or Text()
+        self.type = tpe if tpe is not None else TEXT
         self.is_not_null = not_null
         self.is_primary_key = primary_key
+        self._sql = (f"{name} {self.type}"
+                     f"{' primary key' if primary_key else ''}"
+                     f"{' not null' if not_null else ''}")
 
     def __repr__(self):
-        pk = {True : " primary key", False: ""}[self.is_primary_key]
-        not_null = {True : " not null", False: ""}[self.is_not_null]
-        return f"{self.name} {self.type}{pk}{not_null}"
+        return self._sql
 
 class Table:
     """
@@ -174,8 +365,12 @@ class Table:
                records for the table. If not set then the tag name is 
                assumed to be the same as the name of the table.
                
+    hash_algo - the hashlib constructor used to generate "hash_id" values.
+                Defaults to BLAKE2b with a 16 byte digest.
     """
 
+    hash_algo = staticmethod(partial(blake2b, digest_size=16))
+
     def __init__(self, name, columns, top_tag, fkeys=None, pkey=None,
         parent_table=None, hash_key=None, tag_name=None):
 
@@ -190,7 +385,7 @@ class Table:
                 " parent_table is set.")
         self.columns = {c.name : c for c in columns}
         fkeys = fkeys or []
-        self.foreign_keys = tuple(fk for fk in fkeys)
+        self.foreign_keys = tuple(fkeys)
         self.primary_key = pkey
         self.parent_table = parent_table
         self.hash_key = hash_key
@@ -198,6 +393,25 @@ class Table:
         self.__enforce_hashkey()
         self.__enforce_parent_hash()
 
+        # The declaration is fixed from here on, so everything that
+        # read_row() and __repr__() derive from it is computed once.
+        self._tag_path = None
+        self._create_sql = None
+        self._row_template = dict.fromkeys(self.columns)
+        self._hash_key = tuple(hash_key) if hash_key else ()
+        self._hash_key_values = (_tuple_getter(self._hash_key)
+                                 if self._hash_key else None)
+        # Hashes of this table's records by hash key values, shared by
+        # all child tables. It's an LRU cache of at most _HASH_CACHE_SIZE
+        # entries that lives as long as the table, but is reset whenever
+        # the table itself is read.
+        self._hash_cache = OrderedDict()
+        self._find_rows = _compile_path(tag_name) if parent_table else None
+        self._data_types = {name : (int if isinstance(col.type, Integer)
+                                    else float)
+                            for name, col in self.columns.items()
+                            if isinstance(col.type, (Integer, Real))}
+
     @property
     def filename(self):
         if self.parent_table:
@@ -211,17 +425,22 @@ class Table:
 
 
     def __repr__(self):
+        if self._create_sql is None:
+            self._create_sql = self.__create_sql()
+        return self._create_sql
+
+    def __create_sql(self):
         cols = ',\n'.join([f"  {c}" for c in self.columns.values()])
 
         s = f"""
 create table if not exists {self.name} (
 {cols}"""
 
-        if len(self.foreign_keys) > 0:
+        if self.foreign_keys:
             s += ",\n"
-        s += ',\n'.join([(f" foreign key({key.name}) references " 
-                             f"{key.table.name}({key.column.name})")
-                            for key in self.foreign_keys if key is not None])
+            s += ',\n'.join([(f" foreign key({key.name}) references " 
+                                 f"{key.table.name}({key.column.name})")
+                                for key in self.foreign_keys])
 
 
         if self.primary_key is not None:
@@ -243,8 +462,9 @@ create table if not exists {self.name} (
         assert not self.primary_key, ("A Table with a hash key can't"
                                 " have a primary key declared")
         if "hash_id" not in self.columns:
-            self.columns["hash_id"] = Column("hash_id", primary_key=True,
-                not_null=True)
+            digest_len = self.hash_algo().digest_size * 2
+            self.columns["hash_id"] = Column("hash_id", tpe=Char(digest_len),
+                primary_key=True, not_null=True)
 
 
     def __enforce_parent_hash(self):
@@ -255,82 +475,118 @@ create table if not exists {self.name} (
             self.columns["parent_hash"].is_primary_key:
             return
 
-        self.columns["parent_hash"] = Column("parent_hash", not_null=True)
-        self.foreign_keys = tuple([k for k in self.foreign_keys] + \
-            [ForeignKey("parent_hash", self.parent_table,
-                self.parent_table.columns["hash_id"])] )
+        hash_id = self.parent_table.columns["hash_id"]
+        self.columns["parent_hash"] = Column("parent_hash", tpe=hash_id.type,
+                                             not_null=True)
+        self.foreign_keys += (ForeignKey("parent_hash", self.parent_table,
+                hash_id),)
 
     def build_tag_path(self):
         """
         Returns full XPath to the tag containing records
         for this table, starting from the root tag.
+
+        The path is computed on the first call and reused afterwards.
         """
+        if self._tag_path is not None:
+            return self._tag_path
 
         tag = self.top_tag
         if self.parent_table:
             tag = self.parent_table.build_tag_path()
         if self.tag_name:
-            return f"{tag}/{self.tag_name}"
+            tag = f"{tag}/{self.tag_name}"
+        self._tag_path = tag
         return tag
 
     def get_hash_key(self, row):
-        m = sha256()
-        for key in self.hash_key:
-            try:
-                m.update(str(row[key]).encode('utf-8'))
-            except:
-                print (row[key])
-                raise
+        m = self.hash_algo()
+        for key in self._hash_key:
+            m.update(str(row[key]).encode('utf-8'))
         return m.hexdigest()
 
+    def get_hash_keys(self, cols):
+        """
+        Columnar version of get_hash_key(). *cols* maps column names 
+        to sequences of values, as returned by read_table_columnar().
+
+        Returns a list with the hash of every row.
+        """
+        hash_algo = self.hash_algo
+        encoded = []
+        for key in self._hash_key:
+            col = cols[key]
+            if numpy is not None and isinstance(col, numpy.ndarray):
+                col = col.tolist()
+            encoded.append([str(val).encode('utf-8') for val in col])
+        return [hash_algo(b"".join(vals)).hexdigest()
+                for vals in zip(*encoded)]
+
 
     def read_row(self, node):
-        type_map = {Integer : int, Real: float}
-        data_types = {name : type_map[type(col.type)]
-                      for name,col in self.columns.items() 
-                      if type(col.type) in (Integer, Real)}
-        row ={k : None for k in self.columns.keys()}
+        read_row = _read_row_fast or _read_row
+        return read_row(self.columns, self._data_types, self._row_template,
+                        node)
+
+
+    def read_hash_row(self, node):
+        """
+        Same as read_row() but only reads the columns that make up 
+        the table's hash key. The result is only good for 
+        get_hash_key().
+        """
+        data_types = self._data_types
+        row = dict.fromkeys(self._hash_key)
         for child in node:
-            if child.tag in self.columns:
+            tag = child.tag
+            if tag in row:
                 val = child.text
-                if child.tag in data_types and val is not None:
-                    val = data_types[child.tag](val)
-                row[child.tag] = val
+                if val is not None and tag in data_types:
+                    val = data_types[tag](val)
+                # No early exit: like read_row(), the last of repeated
+                # tags wins
+                row[tag] = val
         return row
 
-
     def __read_child(self, fname):
         assert self.parent_table.hash_key
 
-        parent_tag = self.parent_table.build_tag_path()
-        child_tag = self.tag_name
-        root = ElementTree.parse(fname).getroot()
-
-        data = []
-        for parent in root.findall(parent_tag):
-            parent_row = self.parent_table.read_row(parent)
-            parent_hash = self.parent_table.get_hash_key(parent_row)
-            for el in parent.findall(child_tag):
+        parent_table = self.parent_table
+        parent_tag = parent_table.build_tag_path()
+        find_rows = self._find_rows
+
+        cache = parent_table._hash_cache
+        for parent in _iter_records(fname, parent_tag):
+            hash_row = parent_table.read_hash_row(parent)
+            key = parent_table._hash_key_values(hash_row)
+            parent_hash = cache.get(key)
+            if parent_hash is None:
+                parent_hash = cache[key] = parent_table.get_hash_key(hash_row)
+                if len(cache) > _HASH_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            for el in find_rows(parent):
                 row = self.read_row(el)
                 row["parent_hash"] = parent_hash
-                data.append(row)
-
-        return data
+                yield row
 
-    def __read_parent(self, fname):
+    def __read_parent(self, fname, hashed=True):
         root_tag = self.build_tag_path()
-        root = ElementTree.parse(fname).getroot()
-
-        data = []
-        for el in root.findall(root_tag):
+        self._hash_cache.clear()
 
+        for el in _iter_records(fname, root_tag):
             row = self.read_row(el)
-            if self.hash_key:
+            if self.hash_key and hashed:
                 hash_key = self.get_hash_key(row)
                 row["hash_id"] = hash_key
-            data.append(row)
-        return data
+            yield row
 
+    def __read_rows(self, data_dir, hashed=True):
+        fname = os.path.join(data_dir, self.filename)
+        if self.parent_table:
+            return self.__read_child(fname)
+        return self.__read_parent(fname, hashed)
 
     def read_table(self, data_dir):
         """
@@ -340,13 +596,47 @@ create table if not exists {self.name} (
         Returns a list of dictionaries where each key corresponds to
         a table's column.
         """
+        return list(self.__read_rows(data_dir))
 
-        # TODO: Fix this to do a proper path join.
-        fname = f"{data_dir}/{self.filename}"
-        if self.parent_table:
-            return self.__read_child(fname)
-        data = self.__read_parent(fname)
-        return data
+    def read_table_columnar(self, data_dir):
+        """
+        data_dir - path to the directory containing the XML file for
+                   this table.
+
+        Returns a dictionary mapping each of the table's column names
+        to a sequence of the column's values, in the same order as the
+        rows returned by read_table(). This needs a lot less memory 
+        than a dictionary per row.
+
+        Columns are returned as lists. If NumPy is installed, Integer
+        and Real columns are returned as int64 and float64 arrays 
+        instead, unless they have missing values or (Integer only) a 
+        value that doesn't fit in 64 bits. Those stay lists of Python 
+        objects, so that no value is lost or changed.
+        """
+        cols = {name : [] for name in self.columns}
+        # Hash ids are computed for the whole table at once below
+        appends = [(name, col.append) for name, col in cols.items()
+                   if not (self.hash_key and name == "hash_id")]
+        for row in self.__read_rows(data_dir, hashed=False):
+            for name, append in appends:
+                append(row[name])
+
+        if self.hash_key:
+            cols["hash_id"] = self.get_hash_keys(cols)
+
+        if numpy is not None:
+            for name, tpe in self._data_types.items():
+                col = cols[name]
+                if None in col:
+                    continue
+                dtype = numpy.int64 if tpe is int else numpy.float64
+                try:
+                    cols[name] = numpy.fromiter(col, dtype=dtype,
+                                                count=len(col))
+                except OverflowError:
+                    pass
+        return cols
 
     def sql_inserts(self, data_dir):
         """
@@ -391,7 +681,7 @@ class ForeignKey:
 
 class PrimaryKey:
     def __init__(self, column_names):
-        self.column_names = tuple(c for c in column_names)
+        self.column_names = tuple(column_names)
 
     def __repr__(self):
         return ("primary key "